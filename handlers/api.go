@@ -1,10 +1,14 @@
 package handlers
 
 import (
+	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"log"
 	"net/http"
 	"strconv"
+	"sync"
 	"time"
 
 	"smlgoapi/config"
@@ -56,6 +60,11 @@ func NewAPIHandler(clickHouseService *services.ClickHouseService, postgreSQLServ
 		vectorDB = services.NewTFIDFVectorDatabase(clickHouseService)
 	}
 	thaiAdminService := services.NewThaiAdminService()
+	go func() {
+		if err := thaiAdminService.Preload(); err != nil {
+			log.Printf("⚠️ Failed to preload Thai administrative data: %v", err)
+		}
+	}()
 
 	// Initialize Weaviate service with config
 	var weaviateService *services.WeaviateService
@@ -377,7 +386,35 @@ func (h *APIHandler) PgSelectEndpoint(c *gin.Context) {
 // @Success 200 {object} map[string]interface{}
 // @Router /guide [get]
 func (h *APIHandler) GuideEndpoint(c *gin.Context) {
-	guide := map[string]interface{}{
+	guideOnce.Do(func() {
+		guideBody, guideErr = json.Marshal(buildGuide())
+		if guideErr == nil {
+			guideETag = etagFor(guideBody)
+		}
+	})
+	if guideErr != nil {
+		c.JSON(http.StatusInternalServerError, models.APIResponse{
+			Success: false,
+			Error:   "Failed to encode guide: " + guideErr.Error(),
+		})
+		return
+	}
+
+	writeCachedJSON(c, guideBody, guideETag, time.Hour)
+}
+
+// The guide is static, so it is encoded once and served with an ETag
+// that lets agents revalidate with If-None-Match instead of refetching
+var (
+	guideOnce sync.Once
+	guideBody []byte
+	guideETag string
+	guideErr  error
+)
+
+// buildGuide assembles the API guide document served by GuideEndpoint
+func buildGuide() map[string]interface{} {
+	return map[string]interface{}{
 		"api_name":      "SMLGOAPI",
 		"version":       "2.0.0",
 		"description":   "Advanced Auto Parts API with AI-powered search, multi-language support, and PostgreSQL backend",
@@ -511,9 +548,14 @@ func (h *APIHandler) GuideEndpoint(c *gin.Context) {
 			"thai_provinces": map[string]interface{}{
 				"method":       "POST",
 				"url":          "/get/provinces",
-				"purpose":      "Get all Thai provinces with Thai and English names",
+				"purpose":      "Get all Thai provinces with Thai and English names, optionally filtered by name",
 				"content_type": "application/json",
-				"request_body": map[string]interface{}{}, // Empty object
+				"request_format": map[string]interface{}{
+					"search": "string (optional) - Only provinces whose Thai or English name contains one of the \"|\"-separated terms; omit, send {} or an empty body for all provinces",
+				},
+				"request_example": map[string]interface{}{
+					"search": "กรุง|เชียง",
+				},
 				"response_format": map[string]interface{}{
 					"success": "boolean - Request status",
 					"message": "string - Success message with count",
@@ -565,6 +607,40 @@ func (h *APIHandler) GuideEndpoint(c *gin.Context) {
 				},
 			},
 
+			"thai_amphures_bulk": map[string]interface{}{
+				"method":       "POST",
+				"url":          "/get/amphures/bulk",
+				"purpose":      "Get the districts (amphures) of several provinces in one request, grouped by province ID",
+				"content_type": "application/json",
+				"request_format": map[string]interface{}{
+					"province_ids": "array of integers (required, 1-77 items) - Province IDs from /get/provinces; duplicates collapse into one entry",
+				},
+				"request_example": map[string]interface{}{
+					"province_ids": []int{1, 2},
+				},
+				"response_format": map[string]interface{}{
+					"success": "boolean - Request status",
+					"message": "string - Success message with the number of provinces found",
+					"data":    "object - Province ID to list of amphures; unknown IDs map to an empty list",
+				},
+				"response_example": map[string]interface{}{
+					"success": true,
+					"message": "Retrieved amphures for 2 provinces",
+					"data": map[string]interface{}{
+						"1": []map[string]interface{}{
+							{"id": 1001, "name_th": "เขตพระนคร", "name_en": "Khet Phra Nakhon"},
+						},
+						"2": []map[string]interface{}{
+							{"id": 1101, "name_th": "เมืองสมุทรปราการ", "name_en": "Mueang Samut Prakan"},
+						},
+					},
+				},
+				"use_cases": []string{
+					"Prefetching districts for several provinces at once",
+					"Replacing one /get/amphures call per province",
+				},
+			},
+
 			"thai_tambons": map[string]interface{}{
 				"method":       "POST",
 				"url":          "/get/tambons",
@@ -709,27 +785,58 @@ const result = await executeSQL('select', 'SELECT * FROM products LIMIT 5');
 			"testing": "Use included Postman collection or test frontend HTML",
 		},
 	}
-
-	c.JSON(http.StatusOK, guide)
 }
 
 // Thai Administrative Data Endpoints
 
+// bindThaiAdminRequest binds the JSON request body into req, answering 400
+// and returning false when it is invalid
+func bindThaiAdminRequest(c *gin.Context, req interface{}) bool {
+	if err := c.ShouldBindJSON(req); err != nil {
+		writeThaiAdminError(c, http.StatusBadRequest, "Invalid request format", err)
+		return false
+	}
+	return true
+}
+
+// writeThaiAdminError writes a failed APIResponse as "<message>: <err>"
+func writeThaiAdminError(c *gin.Context, status int, message string, err error) {
+	c.JSON(status, models.APIResponse{
+		Success: false,
+		Error:   message + ": " + err.Error(),
+	})
+}
+
 // GetProvinces godoc
 // @Summary Get all Thai provinces
 // @Description Retrieve all provinces in Thailand with Thai and English names
 // @Tags thai-admin
 // @Accept json
 // @Produce json
+// @Param request body models.ProvinceRequest false "Optional name filter"
 // @Success 200 {object} models.APIResponse{data=[]models.Province}
 // @Router /get/provinces [post]
 func (h *APIHandler) GetProvinces(c *gin.Context) {
-	provinces, err := h.thaiAdminService.GetProvinces()
+	// The body is optional; an empty one means "all provinces". Empty
+	// bodies are not bound at all so this does not depend on the JSON
+	// codec gin is built with; io.EOF covers empty chunked bodies.
+	var req models.ProvinceRequest
+	if c.Request.ContentLength != 0 {
+		if err := c.ShouldBindJSON(&req); err != nil && !errors.Is(err, io.EOF) {
+			writeThaiAdminError(c, http.StatusBadRequest, "Invalid request format", err)
+			return
+		}
+	}
+
+	var provinces []models.Province
+	var err error
+	if req.Search != "" {
+		provinces, err = h.thaiAdminService.SearchProvinces(req.Search)
+	} else {
+		provinces, err = h.thaiAdminService.GetProvinces()
+	}
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, models.APIResponse{
-			Success: false,
-			Error:   "Failed to load provinces: " + err.Error(),
-		})
+		writeThaiAdminError(c, http.StatusInternalServerError, "Failed to load provinces", err)
 		return
 	}
 
@@ -751,20 +858,13 @@ func (h *APIHandler) GetProvinces(c *gin.Context) {
 // @Router /get/amphures [post]
 func (h *APIHandler) GetAmphures(c *gin.Context) {
 	var req models.AmphureRequest
-	if err := c.ShouldBindJSON(&req); err != nil {
-		c.JSON(http.StatusBadRequest, models.APIResponse{
-			Success: false,
-			Error:   "Invalid request format: " + err.Error(),
-		})
+	if !bindThaiAdminRequest(c, &req) {
 		return
 	}
 
 	amphures, err := h.thaiAdminService.GetAmphuresByProvinceID(req.ProvinceID)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, models.APIResponse{
-			Success: false,
-			Error:   "Failed to load amphures: " + err.Error(),
-		})
+		writeThaiAdminError(c, http.StatusInternalServerError, "Failed to load amphures", err)
 		return
 	}
 
@@ -775,6 +875,42 @@ func (h *APIHandler) GetAmphures(c *gin.Context) {
 	})
 }
 
+// GetAmphuresBulk godoc
+// @Summary Get amphures for several provinces
+// @Description Retrieve the districts (amphures) of many provinces in one request, grouped by province ID
+// @Tags thai-admin
+// @Accept json
+// @Produce json
+// @Param request body models.AmphureBulkRequest true "Province IDs"
+// @Success 200 {object} models.APIResponse
+// @Router /get/amphures/bulk [post]
+func (h *APIHandler) GetAmphuresBulk(c *gin.Context) {
+	var req models.AmphureBulkRequest
+	if !bindThaiAdminRequest(c, &req) {
+		return
+	}
+
+	amphures, err := h.thaiAdminService.GetAmphuresByProvinceIDs(req.ProvinceIDs)
+	if err != nil {
+		writeThaiAdminError(c, http.StatusInternalServerError, "Failed to load amphures", err)
+		return
+	}
+
+	// Unknown province IDs map to an empty list; only count the ones found
+	found := 0
+	for _, provinceAmphures := range amphures {
+		if len(provinceAmphures) > 0 {
+			found++
+		}
+	}
+
+	c.JSON(http.StatusOK, models.APIResponse{
+		Success: true,
+		Data:    amphures,
+		Message: fmt.Sprintf("Retrieved amphures for %d provinces", found),
+	})
+}
+
 // GetTambons godoc
 // @Summary Get all tambons in an amphure
 // @Description Retrieve all sub-districts (tambons) in a specified amphure and province
@@ -786,20 +922,13 @@ func (h *APIHandler) GetAmphures(c *gin.Context) {
 // @Router /get/tambons [post]
 func (h *APIHandler) GetTambons(c *gin.Context) {
 	var req models.TambonRequest
-	if err := c.ShouldBindJSON(&req); err != nil {
-		c.JSON(http.StatusBadRequest, models.APIResponse{
-			Success: false,
-			Error:   "Invalid request format: " + err.Error(),
-		})
+	if !bindThaiAdminRequest(c, &req) {
 		return
 	}
 
 	tambons, err := h.thaiAdminService.GetTambonsByAmphureAndProvince(req.AmphureID, req.ProvinceID)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, models.APIResponse{
-			Success: false,
-			Error:   "Failed to load tambons: " + err.Error(),
-		})
+		writeThaiAdminError(c, http.StatusInternalServerError, "Failed to load tambons", err)
 		return
 	}
 
@@ -821,20 +950,13 @@ func (h *APIHandler) GetTambons(c *gin.Context) {
 // @Router /get/findbyzipcode [post]
 func (h *APIHandler) FindByZipCode(c *gin.Context) {
 	var req models.ZipCodeRequest
-	if err := c.ShouldBindJSON(&req); err != nil {
-		c.JSON(http.StatusBadRequest, models.APIResponse{
-			Success: false,
-			Error:   "Invalid request format: " + err.Error(),
-		})
+	if !bindThaiAdminRequest(c, &req) {
 		return
 	}
 
 	locations, err := h.thaiAdminService.FindByZipCode(req.ZipCode)
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, models.APIResponse{
-			Success: false,
-			Error:   "Failed to find locations: " + err.Error(),
-		})
+		writeThaiAdminError(c, http.StatusInternalServerError, "Failed to find locations", err)
 		return
 	}
 
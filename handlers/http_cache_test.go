@@ -0,0 +1,72 @@
+package handlers
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/gin-gonic/gin"
+)
+
+func TestEtagMatches(t *testing.T) {
+	etag := `"abc"`
+	cases := map[string]bool{
+		``:                false,
+		`"abc"`:           true,
+		`W/"abc"`:         true,
+		`"xyz", "abc"`:    true,
+		`*`:               true,
+		`"xyz"`:           false,
+		`abc`:             false,
+		`"xyz",W/"other"`: false,
+	}
+	for header, want := range cases {
+		if got := etagMatches(header, etag); got != want {
+			t.Errorf("etagMatches(%q) = %v, want %v", header, got, want)
+		}
+	}
+}
+
+func TestWriteCachedJSONConditionalGet(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	body := []byte(`{"ok":true}`)
+	etag := etagFor(body)
+
+	router := gin.New()
+	router.GET("/doc", func(c *gin.Context) { writeCachedJSON(c, body, etag, time.Hour) })
+
+	cases := []struct {
+		ifNoneMatch string
+		status      int
+		body        string
+	}{
+		{"", http.StatusOK, string(body)},
+		{`"stale"`, http.StatusOK, string(body)},
+		{etag, http.StatusNotModified, ""},
+		{"W/" + etag, http.StatusNotModified, ""},
+	}
+
+	for _, tc := range cases {
+		req := httptest.NewRequest(http.MethodGet, "/doc", nil)
+		if tc.ifNoneMatch != "" {
+			req.Header.Set("If-None-Match", tc.ifNoneMatch)
+		}
+		w := httptest.NewRecorder()
+		router.ServeHTTP(w, req)
+
+		if w.Code != tc.status {
+			t.Errorf("If-None-Match %q: status %d, want %d", tc.ifNoneMatch, w.Code, tc.status)
+		}
+		if got := w.Body.String(); got != tc.body {
+			t.Errorf("If-None-Match %q: body %q, want %q", tc.ifNoneMatch, got, tc.body)
+		}
+		if got := w.Header().Get("ETag"); got != etag {
+			t.Errorf("If-None-Match %q: ETag %q, want %q", tc.ifNoneMatch, got, etag)
+		}
+		if got := w.Header().Get("Cache-Control"); got != "public, max-age=3600" {
+			t.Errorf("If-None-Match %q: Cache-Control %q", tc.ifNoneMatch, got)
+		}
+	}
+}
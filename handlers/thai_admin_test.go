@@ -0,0 +1,77 @@
+package handlers
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"strings"
+	"testing"
+
+	"smlgoapi/models"
+	"smlgoapi/services"
+
+	"github.com/gin-gonic/gin"
+)
+
+// The Thai admin data files are resolved relative to the repository root
+func TestMain(m *testing.M) {
+	if err := os.Chdir(".."); err != nil {
+		panic(err)
+	}
+	os.Exit(m.Run())
+}
+
+// Run with and without -tags=go_json: the empty-body case must not depend
+// on which JSON codec gin is built with
+func TestGetProvincesRequestBodies(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	h := &APIHandler{thaiAdminService: services.NewThaiAdminService()}
+	router := gin.New()
+	router.POST("/v1/provinces", h.GetProvinces)
+
+	cases := []struct {
+		name      string
+		body      string
+		chunked   bool
+		status    int
+		provinces int
+	}{
+		{"empty body", "", false, http.StatusOK, 77},
+		{"empty chunked body", "", true, http.StatusOK, 77},
+		{"empty object", `{}`, false, http.StatusOK, 77},
+		{"search", `{"search": "เชียง"}`, false, http.StatusOK, 2},
+		{"wrong search type", `{"search":1}`, false, http.StatusBadRequest, 0},
+		{"malformed JSON", `{`, false, http.StatusBadRequest, 0},
+	}
+
+	for _, tc := range cases {
+		req := httptest.NewRequest(http.MethodPost, "/v1/provinces", strings.NewReader(tc.body))
+		req.Header.Set("Content-Type", "application/json")
+		if tc.chunked {
+			req.ContentLength = -1
+		}
+		w := httptest.NewRecorder()
+		router.ServeHTTP(w, req)
+
+		if w.Code != tc.status {
+			t.Errorf("%s: status %d, want %d (body %s)", tc.name, w.Code, tc.status, w.Body.String())
+			continue
+		}
+
+		var response struct {
+			Success bool              `json:"success"`
+			Data    []models.Province `json:"data"`
+		}
+		if err := json.Unmarshal(w.Body.Bytes(), &response); err != nil {
+			t.Fatalf("%s: decoding response: %v", tc.name, err)
+		}
+		if response.Success != (tc.status == http.StatusOK) {
+			t.Errorf("%s: success %v", tc.name, response.Success)
+		}
+		if len(response.Data) != tc.provinces {
+			t.Errorf("%s: got %d provinces, want %d", tc.name, len(response.Data), tc.provinces)
+		}
+	}
+}
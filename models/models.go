@@ -107,7 +107,9 @@ type Tambon struct {
 
 // ProvinceRequest represents a request for province data
 type ProvinceRequest struct {
-	// Empty for now, but can be extended later
+	// Search optionally filters provinces whose Thai or English name contains
+	// the term; several terms can be given separated by "|"
+	Search string `json:"search,omitempty"`
 }
 
 // AmphureRequest represents a request for amphure data
@@ -115,6 +117,12 @@ type AmphureRequest struct {
 	ProvinceID int `json:"province_id" binding:"required"`
 }
 
+// AmphureBulkRequest represents a request for the amphures of several provinces
+type AmphureBulkRequest struct {
+	// Bounded by the 77 Thai provinces; duplicate IDs collapse into one entry
+	ProvinceIDs []int `json:"province_ids" binding:"required,min=1,max=77"`
+}
+
 // TambonRequest represents a request for tambon data
 type TambonRequest struct {
 	AmphureID  int `json:"amphure_id" binding:"required"`
@@ -18,6 +18,7 @@ func RootHandler(c *gin.Context) {
 			// API v1 endpoints (recommended)
 			"v1_provinces":        "POST /v1/provinces",
 			"v1_amphures":         "POST /v1/amphures",
+			"v1_amphures_bulk":    "POST /v1/amphures/bulk",
 			"v1_tambons":          "POST /v1/tambons",
 			"v1_findbyzipcode":    "POST /v1/findbyzipcode",
 			"v1_search_by_vector": "POST /v1/search-by-vector",
@@ -22,7 +22,7 @@ func setupRouter(apiHandler *handlers.APIHandler) *gin.Engine {
 		AllowOrigins:     []string{"*"}, // In production, specify your frontend domain
 		AllowMethods:     []string{"GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD"},
 		AllowHeaders:     []string{"Origin", "Content-Type", "Authorization"},
-		ExposeHeaders:    []string{"Content-Length"},
+		ExposeHeaders:    []string{"Content-Length", "ETag"},
 		AllowCredentials: true,
 		MaxAge:           12 * time.Hour,
 	}))
@@ -53,6 +53,7 @@ func setupRouter(apiHandler *handlers.APIHandler) *gin.Engine {
 		// Thai Administrative Data endpoints
 		v1.POST("/provinces", apiHandler.GetProvinces)
 		v1.POST("/amphures", apiHandler.GetAmphures)
+		v1.POST("/amphures/bulk", apiHandler.GetAmphuresBulk)
 		v1.POST("/tambons", apiHandler.GetTambons)
 		v1.POST("/findbyzipcode", apiHandler.FindByZipCode)
 	}
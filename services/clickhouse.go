@@ -4,6 +4,7 @@ import (
 	"context"
 	"database/sql"
 	"fmt"
+	"time"
 
 	"smlgoapi/config"
 	"smlgoapi/models"
@@ -22,6 +23,10 @@ func NewClickHouseService(config *config.Config) (*ClickHouseService, error) {
 		return nil, fmt.Errorf("failed to open ClickHouse connection: %w", err)
 	}
 
+	// Keep connections alive between requests (see NewPostgreSQLService)
+	db.SetMaxIdleConns(8)
+	db.SetConnMaxIdleTime(5 * time.Minute)
+
 	// Test connection
 	if err := db.Ping(); err != nil {
 		return nil, fmt.Errorf("failed to ping ClickHouse: %w", err)
@@ -7,6 +7,7 @@ import (
 	"log"
 	"strconv"
 	"strings"
+	"time"
 
 	"smlgoapi/config"
 	"smlgoapi/models"
@@ -25,6 +26,15 @@ func NewPostgreSQLService(config *config.Config) (*PostgreSQLService, error) {
 		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
 	}
 
+	// Keep connections alive between requests. database/sql only keeps 2
+	// idle connections by default, so a search (which fans out into price
+	// and balance queries) would otherwise redial on almost every call.
+	// Open connections are left uncapped: the searches keep their count
+	// query's rows open while running the next queries, so a cap could
+	// leave every pooled connection held by a waiting search.
+	db.SetMaxIdleConns(16)
+	db.SetConnMaxIdleTime(5 * time.Minute)
+
 	// Test connection
 	if err := db.Ping(); err != nil {
 		return nil, fmt.Errorf("failed to ping PostgreSQL: %w", err)
@@ -526,19 +536,13 @@ func (s *PostgreSQLService) SearchProducts(ctx context.Context, query string, li
 	}
 	// Build OR conditions for full text search - using ILIKE for better Unicode support
 	// Search only in 'code' and 'name' fields as requested
-	var orConditions []string
-	for range words {
-		orConditions = append(orConditions, "CAST(name AS TEXT) ILIKE ?")
-		orConditions = append(orConditions, "CAST(code AS TEXT) ILIKE ?")
+	// Placeholders are numbered as they are built, in PostgreSQL format
+	orConditions := make([]string, 0, 2*len(words))
+	for i := range words {
+		orConditions = append(orConditions, fmt.Sprintf("CAST(name AS TEXT) ILIKE $%d", 2*i+1))
+		orConditions = append(orConditions, fmt.Sprintf("CAST(code AS TEXT) ILIKE $%d", 2*i+2))
 	}
-
-	// Convert PostgreSQL placeholder format
 	whereClause := strings.Join(orConditions, " OR ")
-	paramIndex := 1
-	for range orConditions {
-		whereClause = strings.Replace(whereClause, "?", fmt.Sprintf("$%d", paramIndex), 1)
-		paramIndex++
-	}
 
 	// Prepare parameters for count query
 	var countParams []interface{}
@@ -680,7 +684,9 @@ func (s *PostgreSQLService) SearchProducts(ctx context.Context, query string, li
 		balanceMap = make(map[string]*BalanceInfo)
 	}
 
-	// Update results with price and balance data
+	// Update results with price and balance data. Per-item details are
+	// collected and logged in one write instead of one log call per row.
+	var details strings.Builder
 	for i, result := range results {
 		code := result["code"].(string)
 
@@ -695,21 +701,24 @@ func (s *PostgreSQLService) SearchProducts(ctx context.Context, query string, li
 			results[i]["discount_price"] = discountPrice
 			results[i]["price"] = salePrice // Update legacy field too
 
-			log.Printf("💰 Found price for %s: sale_price=%.2f, final_price=%.2f, discount_price=%.2f",
+			fmt.Fprintf(&details, "\n   💰 Found price for %s: sale_price=%.2f, final_price=%.2f, discount_price=%.2f",
 				code, salePrice, finalPrice, discountPrice)
 		} else {
-			log.Printf("⚠️ No price found for ic_code: %s - using defaults", code)
+			fmt.Fprintf(&details, "\n   ⚠️ No price found for ic_code: %s - using defaults", code)
 		}
 
 		// Look up real balance data
 		if balanceInfo, exists := balanceMap[code]; exists {
 			qtyAvailable := balanceInfo.TotalQty // Use sum of balance_qty as qty_available
 			results[i]["qty_available"] = qtyAvailable
-			log.Printf("📦 Found balance for %s: qty_available=%.2f", code, qtyAvailable)
+			fmt.Fprintf(&details, "\n   📦 Found balance for %s: qty_available=%.2f", code, qtyAvailable)
 		} else {
-			log.Printf("⚠️ No balance found for ic_code: %s - using default (0.0)", code)
+			fmt.Fprintf(&details, "\n   ⚠️ No balance found for ic_code: %s - using default (0.0)", code)
 		}
 	}
+	if details.Len() > 0 {
+		log.Printf("🏷️ Price and balance for %d results:%s", len(results), details.String())
+	}
 
 	log.Printf("✅ Search completed: found %d results, total count: %d", len(results), totalCount)
 	return results, totalCount, nil
@@ -739,7 +748,8 @@ func (s *PostgreSQLService) enrichResultsWithPriceAndBalance(ctx context.Context
 		balanceMap = make(map[string]*BalanceInfo)
 	}
 
-	// Update results with price and balance data
+	// Update results with price and balance data, logging once (see SearchProducts)
+	var details strings.Builder
 	for i, result := range results {
 		code := result["code"].(string)
 
@@ -754,7 +764,7 @@ func (s *PostgreSQLService) enrichResultsWithPriceAndBalance(ctx context.Context
 			results[i]["discount_price"] = discountPrice
 			results[i]["price"] = salePrice
 
-			log.Printf("💰 Found price for %s: sale_price=%.2f, final_price=%.2f, discount_price=%.2f",
+			fmt.Fprintf(&details, "\n   💰 Found price for %s: sale_price=%.2f, final_price=%.2f, discount_price=%.2f",
 				code, salePrice, finalPrice, discountPrice)
 		}
 
@@ -762,9 +772,12 @@ func (s *PostgreSQLService) enrichResultsWithPriceAndBalance(ctx context.Context
 		if balanceInfo, exists := balanceMap[code]; exists {
 			qtyAvailable := balanceInfo.TotalQty
 			results[i]["qty_available"] = qtyAvailable
-			log.Printf("📦 Found balance for %s: qty_available=%.2f", code, qtyAvailable)
+			fmt.Fprintf(&details, "\n   📦 Found balance for %s: qty_available=%.2f", code, qtyAvailable)
 		}
 	}
+	if details.Len() > 0 {
+		log.Printf("🏷️ Price and balance for %d results:%s", len(results), details.String())
+	}
 }
 
 // SearchProductsByExactBarcode searches specifically in ic_inventory_barcode.barcode field
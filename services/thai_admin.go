@@ -2,21 +2,40 @@ package services
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
-	"io/ioutil"
+	"io"
+	"os"
 	"path/filepath"
 	"smlgoapi/models"
+	"strings"
+	"sync"
 )
 
 // ThaiAdminService handles Thai administrative data operations
 type ThaiAdminService struct {
-	provincesData          []models.Province
-	amphuresData           []models.Amphure
-	tambonsData            []models.Tambon
-	provincesLoaded        bool
-	amphuresLoaded         bool
-	tambonsLoaded          bool
-	completeLocationData   []models.CompleteLocationData
+	// One mutex per data file, so concurrent requests (e.g. clients
+	// fanning out one amphures call per province) neither race on the
+	// loaded flags nor parse the same file twice, while different files
+	// can still load in parallel
+	provincesMu        sync.Mutex
+	amphuresMu         sync.Mutex
+	tambonsMu          sync.Mutex
+	completeLocationMu sync.Mutex
+
+	provincesData   []models.Province
+	provincesLoaded bool
+	amphuresLoaded  bool
+	tambonsLoaded   bool
+
+	// Lookup indexes built once at load time, so per-request lookups are
+	// map hits instead of scans over every amphure/tambon/location. Entries
+	// hold only the fields the API returns, so getters can hand them out
+	// without building a new slice per call.
+	amphuresByProvince     map[int][]models.Amphure
+	amphureProvinceID      map[int]int
+	tambonsByAmphure       map[int][]models.Tambon
+	locationsByZipCode     map[int][]models.CompleteLocationData
 	completeLocationLoaded bool
 }
 
@@ -25,22 +44,61 @@ func NewThaiAdminService() *ThaiAdminService {
 	return &ThaiAdminService{}
 }
 
+// decodeJSONArray streams a top-level JSON array from r, calling fn for each
+// element so large data files are never held in memory as raw bytes plus a
+// fully decoded copy
+func decodeJSONArray[T any](r io.Reader, fn func(T)) error {
+	dec := json.NewDecoder(r)
+
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != '[' {
+		return fmt.Errorf("expected a JSON array, got %v", tok)
+	}
+
+	for dec.More() {
+		var item T
+		if err := dec.Decode(&item); err != nil {
+			return err
+		}
+		fn(item)
+	}
+
+	_, err = dec.Token()
+	return err
+}
+
 // loadProvinces loads province data from JSON file
 func (s *ThaiAdminService) loadProvinces() error {
+	s.provincesMu.Lock()
+	defer s.provincesMu.Unlock()
+
 	if s.provincesLoaded {
 		return nil
 	}
 
 	filePath := filepath.Join("provinces", "api_province.json")
-	data, err := ioutil.ReadFile(filePath)
+	file, err := os.Open(filePath)
 	if err != nil {
 		return fmt.Errorf("failed to read provinces file: %v", err)
 	}
+	defer file.Close()
 
-	err = json.Unmarshal(data, &s.provincesData)
+	var provinces []models.Province
+	err = decodeJSONArray(file, func(province models.Province) {
+		// Keep only essential fields as specified in the docs
+		provinces = append(provinces, models.Province{
+			ID:     province.ID,
+			NameTh: province.NameTh,
+			NameEn: province.NameEn,
+		})
+	})
 	if err != nil {
 		return fmt.Errorf("failed to parse provinces JSON: %v", err)
 	}
+	s.provincesData = provinces
 
 	s.provincesLoaded = true
 	return nil
@@ -48,17 +106,30 @@ func (s *ThaiAdminService) loadProvinces() error {
 
 // loadAmphures loads amphure data from JSON file
 func (s *ThaiAdminService) loadAmphures() error {
+	s.amphuresMu.Lock()
+	defer s.amphuresMu.Unlock()
+
 	if s.amphuresLoaded {
 		return nil
 	}
 
 	filePath := filepath.Join("provinces", "api_amphure.json")
-	data, err := ioutil.ReadFile(filePath)
+	file, err := os.Open(filePath)
 	if err != nil {
 		return fmt.Errorf("failed to read amphures file: %v", err)
 	}
-
-	err = json.Unmarshal(data, &s.amphuresData)
+	defer file.Close()
+
+	s.amphuresByProvince = make(map[int][]models.Amphure)
+	s.amphureProvinceID = make(map[int]int)
+	err = decodeJSONArray(file, func(amphure models.Amphure) {
+		s.amphuresByProvince[amphure.ProvinceID] = append(s.amphuresByProvince[amphure.ProvinceID], models.Amphure{
+			ID:     amphure.ID,
+			NameTh: amphure.NameTh,
+			NameEn: amphure.NameEn,
+		})
+		s.amphureProvinceID[amphure.ID] = amphure.ProvinceID
+	})
 	if err != nil {
 		return fmt.Errorf("failed to parse amphures JSON: %v", err)
 	}
@@ -69,17 +140,28 @@ func (s *ThaiAdminService) loadAmphures() error {
 
 // loadTambons loads tambon data from JSON file
 func (s *ThaiAdminService) loadTambons() error {
+	s.tambonsMu.Lock()
+	defer s.tambonsMu.Unlock()
+
 	if s.tambonsLoaded {
 		return nil
 	}
 
 	filePath := filepath.Join("provinces", "api_tambon.json")
-	data, err := ioutil.ReadFile(filePath)
+	file, err := os.Open(filePath)
 	if err != nil {
 		return fmt.Errorf("failed to read tambons file: %v", err)
 	}
-
-	err = json.Unmarshal(data, &s.tambonsData)
+	defer file.Close()
+
+	s.tambonsByAmphure = make(map[int][]models.Tambon)
+	err = decodeJSONArray(file, func(tambon models.Tambon) {
+		s.tambonsByAmphure[tambon.AmphureID] = append(s.tambonsByAmphure[tambon.AmphureID], models.Tambon{
+			ID:     tambon.ID,
+			NameTh: tambon.NameTh,
+			NameEn: tambon.NameEn,
+		})
+	})
 	if err != nil {
 		return fmt.Errorf("failed to parse tambons JSON: %v", err)
 	}
@@ -88,48 +170,109 @@ func (s *ThaiAdminService) loadTambons() error {
 	return nil
 }
 
-// GetProvinces returns all provinces
+// Preload loads every data file concurrently so the first requests do not
+// pay for reading and indexing them
+func (s *ThaiAdminService) Preload() error {
+	loaders := []func() error{
+		s.loadProvinces,
+		s.loadAmphures,
+		s.loadTambons,
+		s.loadCompleteLocationData,
+	}
+
+	errs := make([]error, len(loaders))
+	var wg sync.WaitGroup
+	for i, load := range loaders {
+		wg.Add(1)
+		go func(i int, load func() error) {
+			defer wg.Done()
+			errs[i] = load()
+		}(i, load)
+	}
+	wg.Wait()
+
+	return errors.Join(errs...)
+}
+
+// GetProvinces returns all provinces. The returned slice is shared and must
+// not be modified.
 func (s *ThaiAdminService) GetProvinces() ([]models.Province, error) {
 	err := s.loadProvinces()
 	if err != nil {
 		return nil, err
 	}
 
-	// Return only essential fields as specified in the docs
-	var result []models.Province
+	return s.provincesData, nil
+}
+
+// SearchProvinces returns the provinces whose Thai or English name contains
+// any of the "|"-separated terms in search (English matched case-insensitively).
+// A search with no non-empty terms returns every province.
+func (s *ThaiAdminService) SearchProvinces(search string) ([]models.Province, error) {
+	err := s.loadProvinces()
+	if err != nil {
+		return nil, err
+	}
+
+	var terms []string
+	for _, term := range strings.Split(search, "|") {
+		if term = strings.ToLower(strings.TrimSpace(term)); term != "" {
+			terms = append(terms, term)
+		}
+	}
+	if len(terms) == 0 {
+		return s.provincesData, nil
+	}
+
+	result := []models.Province{}
 	for _, province := range s.provincesData {
-		result = append(result, models.Province{
-			ID:     province.ID,
-			NameTh: province.NameTh,
-			NameEn: province.NameEn,
-		})
+		nameEn := strings.ToLower(province.NameEn)
+		for _, term := range terms {
+			if strings.Contains(province.NameTh, term) || strings.Contains(nameEn, term) {
+				result = append(result, province)
+				break
+			}
+		}
 	}
 
 	return result, nil
 }
 
-// GetAmphuresByProvinceID returns all amphures for a given province
+// GetAmphuresByProvinceID returns all amphures for a given province. The
+// returned slice is shared and must not be modified.
 func (s *ThaiAdminService) GetAmphuresByProvinceID(provinceID int) ([]models.Amphure, error) {
 	err := s.loadAmphures()
 	if err != nil {
 		return nil, err
 	}
 
-	var result []models.Amphure
-	for _, amphure := range s.amphuresData {
-		if amphure.ProvinceID == provinceID {
-			result = append(result, models.Amphure{
-				ID:     amphure.ID,
-				NameTh: amphure.NameTh,
-				NameEn: amphure.NameEn,
-			})
+	return s.amphuresByProvince[provinceID], nil
+}
+
+// GetAmphuresByProvinceIDs returns the amphures of several provinces, keyed
+// by province ID, in the same shape as GetAmphuresByProvinceID. Duplicate IDs
+// collapse into one entry and unknown IDs map to an empty list. The returned
+// slices are shared and must not be modified.
+func (s *ThaiAdminService) GetAmphuresByProvinceIDs(provinceIDs []int) (map[int][]models.Amphure, error) {
+	err := s.loadAmphures()
+	if err != nil {
+		return nil, err
+	}
+
+	result := make(map[int][]models.Amphure, len(provinceIDs))
+	for _, provinceID := range provinceIDs {
+		amphures, ok := s.amphuresByProvince[provinceID]
+		if !ok {
+			amphures = []models.Amphure{}
 		}
+		result[provinceID] = amphures
 	}
 
 	return result, nil
 }
 
-// GetTambonsByAmphureAndProvince returns all tambons for a given amphure and province
+// GetTambonsByAmphureAndProvince returns all tambons for a given amphure and
+// province. The returned slice is shared and must not be modified.
 func (s *ThaiAdminService) GetTambonsByAmphureAndProvince(amphureID, provinceID int) ([]models.Tambon, error) {
 	err := s.loadTambons()
 	if err != nil {
@@ -142,54 +285,33 @@ func (s *ThaiAdminService) GetTambonsByAmphureAndProvince(amphureID, provinceID
 		return nil, err
 	}
 
-	var amphureFound bool
-	for _, amphure := range s.amphuresData {
-		if amphure.ID == amphureID && amphure.ProvinceID == provinceID {
-			amphureFound = true
-			break
-		}
-	}
-
-	if !amphureFound {
+	if owner, ok := s.amphureProvinceID[amphureID]; !ok || owner != provinceID {
 		return nil, fmt.Errorf("amphure_id %d not found in province_id %d", amphureID, provinceID)
 	}
 
-	var result []models.Tambon
-	for _, tambon := range s.tambonsData {
-		if tambon.AmphureID == amphureID {
-			result = append(result, models.Tambon{
-				ID:     tambon.ID,
-				NameTh: tambon.NameTh,
-				NameEn: tambon.NameEn,
-			})
-		}
-	}
-
-	return result, nil
+	return s.tambonsByAmphure[amphureID], nil
 }
 
 // loadCompleteLocationData loads complete location data from JSON file
 func (s *ThaiAdminService) loadCompleteLocationData() error {
+	s.completeLocationMu.Lock()
+	defer s.completeLocationMu.Unlock()
+
 	if s.completeLocationLoaded {
 		return nil
 	}
 
 	filePath := filepath.Join("provinces", "api_revert_tambon_with_amphure_province.json")
-	data, err := ioutil.ReadFile(filePath)
+	file, err := os.Open(filePath)
 	if err != nil {
 		return fmt.Errorf("failed to read complete location file: %v", err)
 	}
+	defer file.Close()
 
-	var tambonsWithNested []models.TambonWithNested
-	err = json.Unmarshal(data, &tambonsWithNested)
-	if err != nil {
-		return fmt.Errorf("failed to parse complete location JSON: %v", err)
-	}
-
-	// Convert to our CompleteLocationData structure
-	s.completeLocationData = make([]models.CompleteLocationData, len(tambonsWithNested))
-	for i, tambon := range tambonsWithNested {
-		s.completeLocationData[i] = models.CompleteLocationData{
+	// Convert to our CompleteLocationData structure, indexed by zip code
+	s.locationsByZipCode = make(map[int][]models.CompleteLocationData)
+	err = decodeJSONArray(file, func(tambon models.TambonWithNested) {
+		location := models.CompleteLocationData{
 			Province: models.Province{
 				ID:     tambon.Amphure.Province.ID,
 				NameTh: tambon.Amphure.Province.NameTh,
@@ -207,42 +329,23 @@ func (s *ThaiAdminService) loadCompleteLocationData() error {
 				ZipCode: tambon.ZipCode,
 			},
 		}
+		s.locationsByZipCode[tambon.ZipCode] = append(s.locationsByZipCode[tambon.ZipCode], location)
+	})
+	if err != nil {
+		return fmt.Errorf("failed to parse complete location JSON: %v", err)
 	}
 
 	s.completeLocationLoaded = true
 	return nil
 }
 
-// FindByZipCode finds all locations with the given zip code
+// FindByZipCode finds all locations with the given zip code. The returned
+// slice is shared and must not be modified.
 func (s *ThaiAdminService) FindByZipCode(zipCode int) ([]models.CompleteLocationData, error) {
 	err := s.loadCompleteLocationData()
 	if err != nil {
 		return nil, err
 	}
 
-	var result []models.CompleteLocationData
-	for _, location := range s.completeLocationData {
-		if location.Tambon.ZipCode == zipCode {
-			result = append(result, models.CompleteLocationData{
-				Province: models.Province{
-					ID:     location.Province.ID,
-					NameTh: location.Province.NameTh,
-					NameEn: location.Province.NameEn,
-				},
-				Amphure: models.Amphure{
-					ID:     location.Amphure.ID,
-					NameTh: location.Amphure.NameTh,
-					NameEn: location.Amphure.NameEn,
-				},
-				Tambon: models.Tambon{
-					ID:      location.Tambon.ID,
-					NameTh:  location.Tambon.NameTh,
-					NameEn:  location.Tambon.NameEn,
-					ZipCode: location.Tambon.ZipCode,
-				},
-			})
-		}
-	}
-
-	return result, nil
+	return s.locationsByZipCode[zipCode], nil
 }
@@ -0,0 +1,218 @@
+package services
+
+import (
+	"crypto/sha1"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"reflect"
+	"strings"
+	"testing"
+
+	"smlgoapi/models"
+)
+
+// The data files are resolved relative to the repository root
+func TestMain(m *testing.M) {
+	if err := os.Chdir(".."); err != nil {
+		panic(err)
+	}
+	os.Exit(m.Run())
+}
+
+func TestGetAmphuresByProvinceIDsGroupsByProvince(t *testing.T) {
+	s := NewThaiAdminService()
+
+	result, err := s.GetAmphuresByProvinceIDs([]int{1, 2, 1, 999})
+	if err != nil {
+		t.Fatalf("GetAmphuresByProvinceIDs: %v", err)
+	}
+
+	if len(result) != 3 {
+		t.Fatalf("got %d groups, want 3 (duplicates collapsed)", len(result))
+	}
+
+	for _, provinceID := range []int{1, 2} {
+		single, err := s.GetAmphuresByProvinceID(provinceID)
+		if err != nil {
+			t.Fatalf("GetAmphuresByProvinceID(%d): %v", provinceID, err)
+		}
+		if len(single) == 0 {
+			t.Fatalf("province %d has no amphures", provinceID)
+		}
+		if !reflect.DeepEqual(result[provinceID], single) {
+			t.Errorf("bulk amphures for province %d differ from /amphures", provinceID)
+		}
+	}
+
+	if unknown, ok := result[999]; !ok || unknown == nil || len(unknown) != 0 {
+		t.Errorf("unknown province: got %#v, want empty non-nil list", unknown)
+	}
+}
+
+func TestSearchProvinces(t *testing.T) {
+	s := NewThaiAdminService()
+	ids := func(provinces []models.Province) []int {
+		result := []int{}
+		for _, province := range provinces {
+			result = append(result, province.ID)
+		}
+		return result
+	}
+
+	cases := map[string][]int{
+		"กรุง| เชียง |bang": {1, 38, 45},
+		"CHIANG":            {38, 45},
+		"no such province":  {},
+	}
+	for search, want := range cases {
+		result, err := s.SearchProvinces(search)
+		if err != nil {
+			t.Fatalf("SearchProvinces(%q): %v", search, err)
+		}
+		if got := ids(result); !reflect.DeepEqual(got, want) {
+			t.Errorf("SearchProvinces(%q) = %v, want %v", search, got, want)
+		}
+	}
+
+	all, err := s.GetProvinces()
+	if err != nil {
+		t.Fatalf("GetProvinces: %v", err)
+	}
+	for _, search := range []string{" ", "|", " | "} {
+		result, err := s.SearchProvinces(search)
+		if err != nil {
+			t.Fatalf("SearchProvinces(%q): %v", search, err)
+		}
+		if !reflect.DeepEqual(result, all) {
+			t.Errorf("SearchProvinces(%q) returned %d provinces, want all %d", search, len(result), len(all))
+		}
+	}
+}
+
+func TestGettersServePrecomputedProjections(t *testing.T) {
+	s := NewThaiAdminService()
+	if err := s.Preload(); err != nil {
+		t.Fatalf("Preload: %v", err)
+	}
+
+	allocs := testing.AllocsPerRun(100, func() {
+		s.GetProvinces()
+		s.GetAmphuresByProvinceID(1)
+		s.GetTambonsByAmphureAndProvince(1001, 1)
+	})
+	if allocs != 0 {
+		t.Errorf("getters allocate %.0f times per call, want 0", allocs)
+	}
+
+	tambons, err := s.GetTambonsByAmphureAndProvince(1001, 1)
+	if err != nil || len(tambons) == 0 {
+		t.Fatalf("GetTambonsByAmphureAndProvince(1001, 1) = %d tambons, %v", len(tambons), err)
+	}
+	for _, tambon := range tambons {
+		if tambon.CreatedAt != "" || tambon.UpdatedAt != "" || tambon.DeletedAt != nil {
+			t.Fatalf("tambon %d keeps fields that are never served: %+v", tambon.ID, tambon)
+		}
+	}
+}
+
+// Digests of the encoded getter output recorded from the original
+// scan-based implementation, before the data was streamed, indexed and
+// pre-projected. Any change here is a change to the public payloads.
+const (
+	baselineProvincesSHA1 = "02a351c9beb8406df64f60ddb76e78ee4cd248ea"
+	baselineAmphuresSHA1  = "5a76ba177a22380c2154cf709693b66f26144bae"
+	baselineTambonsSHA1   = "9c324e9ea9582ea7047b3adeac8a13e19a120814"
+	baselineZipCodesSHA1  = "ffc7c83c984f28c5029f1d478c5f9e0131cd61d1"
+	baselineZipCodeCount  = 955
+)
+
+func TestGettersMatchBaselineOutput(t *testing.T) {
+	s := NewThaiAdminService()
+	encode := func(v interface{}) []byte {
+		b, err := json.Marshal(v)
+		if err != nil {
+			t.Fatalf("json.Marshal: %v", err)
+		}
+		return b
+	}
+
+	provinces, err := s.GetProvinces()
+	if err != nil {
+		t.Fatalf("GetProvinces: %v", err)
+	}
+	provincesHash := sha1.Sum(encode(provinces))
+
+	amphuresHash, tambonsHash := sha1.New(), sha1.New()
+	for _, province := range provinces {
+		amphures, err := s.GetAmphuresByProvinceID(province.ID)
+		if err != nil {
+			t.Fatalf("GetAmphuresByProvinceID(%d): %v", province.ID, err)
+		}
+		amphuresHash.Write(encode(amphures))
+
+		for _, amphure := range amphures {
+			tambons, err := s.GetTambonsByAmphureAndProvince(amphure.ID, province.ID)
+			if err != nil {
+				t.Fatalf("GetTambonsByAmphureAndProvince(%d, %d): %v", amphure.ID, province.ID, err)
+			}
+			tambonsHash.Write(encode(tambons))
+		}
+	}
+
+	zipCodesHash, zipCodeCount := sha1.New(), 0
+	for zipCode := 10000; zipCode < 97000; zipCode++ {
+		locations, err := s.FindByZipCode(zipCode)
+		if err != nil {
+			t.Fatalf("FindByZipCode(%d): %v", zipCode, err)
+		}
+		if locations != nil {
+			zipCodeCount++
+		}
+		zipCodesHash.Write(encode(locations))
+	}
+
+	checks := []struct {
+		name, got, want string
+	}{
+		{"provinces", hex.EncodeToString(provincesHash[:]), baselineProvincesSHA1},
+		{"amphures", hex.EncodeToString(amphuresHash.Sum(nil)), baselineAmphuresSHA1},
+		{"tambons", hex.EncodeToString(tambonsHash.Sum(nil)), baselineTambonsSHA1},
+		{"zip codes", hex.EncodeToString(zipCodesHash.Sum(nil)), baselineZipCodesSHA1},
+	}
+	for _, check := range checks {
+		if check.got != check.want {
+			t.Errorf("%s output changed: sha1 %s, want %s", check.name, check.got, check.want)
+		}
+	}
+	if zipCodeCount != baselineZipCodeCount {
+		t.Errorf("got %d zip codes with locations, want %d", zipCodeCount, baselineZipCodeCount)
+	}
+
+	if _, err := s.GetTambonsByAmphureAndProvince(1001, 2); err == nil {
+		t.Error("amphure 1001 outside province 2: want error")
+	}
+}
+
+func TestDecodeJSONArray(t *testing.T) {
+	var ids []int
+	err := decodeJSONArray(strings.NewReader(`[{"id": 1}, {"id": 2}]`), func(p struct{ ID int }) {
+		ids = append(ids, p.ID)
+	})
+	if err != nil || !reflect.DeepEqual(ids, []int{1, 2}) {
+		t.Fatalf("got %v, %v; want [1 2], nil", ids, err)
+	}
+
+	invalid := map[string]string{
+		"empty":        ``,
+		"not an array": `{"id": 1}`,
+		"bad element":  `[{"id": 1}, {"id": "two"}]`,
+		"truncated":    `[{"id": 1},`,
+	}
+	for name, input := range invalid {
+		err := decodeJSONArray(strings.NewReader(input), func(struct{ ID int }) {})
+		if err == nil {
+			t.Errorf("%s: want error", name)
+		}
+	}
+}
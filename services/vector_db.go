@@ -28,6 +28,11 @@ type Document struct {
 	ImgURL   string                 `json:"img_url"`
 	Metadata map[string]interface{} `json:"metadata"`
 	TF       map[string]float64     `json:"tf"`
+
+	// Lower-cased ID and Name, folded once at load time so the substring
+	// scans in searchByCode/searchByName do not allocate per document
+	idLower   string
+	nameLower string
 }
 
 type SearchResult struct {
@@ -116,7 +121,9 @@ func (vdb *TFIDFVectorDatabase) LoadDocuments(ctx context.Context) error { // Qu
 				"code": code,
 				// Other fields will be fetched later during search
 			},
-			TF: make(map[string]float64),
+			TF:        make(map[string]float64),
+			idLower:   strings.ToLower(code),
+			nameLower: strings.ToLower(name),
 		}
 
 		// Tokenize and calculate term frequency
@@ -402,7 +409,7 @@ func (vdb *TFIDFVectorDatabase) searchByCode(ctx context.Context, query string,
 	queryLower := strings.ToLower(query)
 
 	for _, doc := range vdb.documents { // Check if document ID (product code) contains the query
-		if strings.Contains(strings.ToLower(doc.ID), queryLower) {
+		if strings.Contains(doc.idLower, queryLower) {
 			imgURL := ""
 			if url, exists := doc.Metadata["img_url"]; exists {
 				if urlStr, ok := url.(string); ok {
@@ -451,7 +458,7 @@ func (vdb *TFIDFVectorDatabase) searchByName(ctx context.Context, query string,
 	queryLower := strings.ToLower(query)
 
 	for _, doc := range vdb.documents { // Check if document name contains the query
-		if strings.Contains(strings.ToLower(doc.Name), queryLower) {
+		if strings.Contains(doc.nameLower, queryLower) {
 			imgURL := ""
 			if url, exists := doc.Metadata["img_url"]; exists {
 				if urlStr, ok := url.(string); ok {